@@ -13,6 +13,12 @@ class DictView(qt.QtWidgets.QWidget):
     - expand, collapse and hide keys/branches
     """
 
+    DIRTEXT_SEPARATOR = ' > '
+    DIRTEXT_ROLE = int(qt.QtCore.Qt.ItemDataRole.UserRole) + 1
+    """Item data role under which the directory text (with the default
+    separator DIRTEXT_SEPARATOR) of a QTreeWidgetItem is cached, see
+    get_dirtext."""
+
     def __init__(self, snap: dict, title: str = '', screen=None,
                  timestamps=None):
         """
@@ -54,13 +60,23 @@ class DictView(qt.QtWidgets.QWidget):
             0, int(.5 * .4 * screen_size.width()))
         self.tree_widget.setExpandsOnDoubleClick(True)
 
+        # The children of the tree items are only created when the items are
+        # expanded (or when a feature needs the full tree, e.g. the search).
+        # Maps QTreeWidgetItem to the (dictdata, param) arguments of
+        # dict_to_titem for its children, see populate_titem.
+        self._pending_subtrees = {}
+        self.tree_widget.itemExpanded.connect(self.populate_titem)
+
         self.root_item = self.tree_widget.invisibleRootItem()
-        # build up the tree recursively from a dictionary
+        # the displayed dictionary, used to find the 'parameters' branches
+        # without creating the rest of the tree, see expand_parameters
+        self.snap = snap
+        # build up the first level of the tree from a dictionary
         self.dict_to_titem(snap, self.root_item)
         self.tree_widget.addTopLevelItem(self.root_item)
 
         # expand all parameter branches by default
-        self.expand_parameters(self.root_item)
+        self.expand_parameters()
 
         # sorting needs to be set after initialization of tree elements
         # lets user choose which column is used to sort
@@ -167,7 +183,7 @@ class DictView(qt.QtWidgets.QWidget):
         self.closeAction.triggered.connect(self.close)
         self.resetWindowAction.triggered.connect(self.reset_window)
         self.expandParametersAction.triggered.connect(
-            lambda: self.expand_parameters(self.root_item))
+            lambda: self.expand_parameters())
         self.copyStationPathAction.triggered.connect(self.copy_station_path)
 
     def _set_menu_bar(self):
@@ -225,19 +241,58 @@ class DictView(qt.QtWidgets.QWidget):
         """
         self.show_all(self.root_item)
         self.expand_branch(self.root_item, expand=False)
-        self.expand_parameters(self.root_item)
-
-    def expand_parameters(self, tree_item: qt.QtWidgets.QTreeWidgetItem):
-        """
-        Expands recursively all QTreeWidgetItem with key name 'parameters'
-        Args:
-            tree_item (QTreeWidgetItem): Item from which all instances with
-            key name 'parameters' are expanded
-        """
-        if tree_item.data(0, 0) == 'parameters':
-            tree_item.setExpanded(True)
-        for i in range(tree_item.childCount()):
-            self.expand_parameters(tree_item.child(i))
+        self.expand_parameters()
+
+    def expand_parameters(self):
+        """
+        Expands all QTreeWidgetItem with key name 'parameters'. Only the
+        items on the paths from the root item to the 'parameters' items are
+        created, the other branches are created when they are expanded.
+        """
+        # Find the dictionaries which contain a 'parameters' dictionary at
+        # any depth. Pre-order traversal with an explicit stack, such that
+        # arbitrarily deep dictionaries can be displayed. The ids are only
+        # used within this method, while self.snap keeps the dictionaries
+        # alive.
+        order = []
+        visited = set()
+        stack = [self.snap]
+        while stack:
+            dictdata = stack.pop()
+            if id(dictdata) in visited:
+                continue
+            visited.add(id(dictdata))
+            order.append(dictdata)
+            stack += [val for key, val in dictdata.items()
+                      if isinstance(val, dict) and key != 'parameters']
+        with_parameters = set()
+        # children are processed before their parents
+        for dictdata in reversed(order):
+            if any(isinstance(val, dict) and (
+                    key == 'parameters' or id(val) in with_parameters)
+                   for key, val in dictdata.items()):
+                with_parameters.add(id(dictdata))
+
+        stack = [(self.root_item, self.snap)]
+        while stack:
+            tree_item, dictdata = stack.pop()
+            if id(dictdata) not in with_parameters:
+                continue
+            self.populate_titem(tree_item)
+            children = {}
+            for i in range(tree_item.childCount()):
+                children.setdefault(tree_item.child(i).data(0, 0),
+                                    tree_item.child(i))
+            for key, val in dictdata.items():
+                child = children.get(str(key))
+                if child is None or not isinstance(val, dict):
+                    continue
+                if key == 'parameters':
+                    # the contents of the parameters are only created on
+                    # demand, i.e., when the item is expanded
+                    child.setExpanded(True)
+                else:
+                    stack.append((child, val))
 
     def expand_branch(self, tree_item: qt.QtWidgets.QTreeWidgetItem,
                       expand=True, display_vals=True):
@@ -253,13 +308,18 @@ class DictView(qt.QtWidgets.QWidget):
                 and forces the user to force quit the program.
                 This might restart the kernel.
         """
-        tree_item.setExpanded(expand)
-        if not display_vals:
-            if tree_item.data(0, 0) == 'parameters':
-                return
-        for i in range(tree_item.childCount()):
-            self.expand_branch(tree_item.child(i), expand=expand,
-                               display_vals=display_vals)
+        if expand:
+            # creates the entire branch at once, with sorting disabled
+            self.populate_titem(tree_item, recursive=True)
+        stack = [tree_item]
+        while stack:
+            tree_item = stack.pop()
+            tree_item.setExpanded(expand)
+            if not display_vals:
+                if tree_item.data(0, 0) == 'parameters':
+                    continue
+            stack += [tree_item.child(i)
+                      for i in range(tree_item.childCount())]
 
     def set_dirtext(self):
         """
@@ -269,20 +329,35 @@ class DictView(qt.QtWidgets.QWidget):
         self.tree_dir.setText(self.get_dirtext(self.tree_widget.currentItem()))
 
     def get_dirtext(self, tree_item: qt.QtWidgets.QTreeWidgetItem,
-                    separator=' > '):
+                    separator=DIRTEXT_SEPARATOR):
         """
         Returns string of the directory of a given QWidgetItem in a QWidgetTree
+        The directory text with the default separator is cached on the items
+        (data role DIRTEXT_ROLE), since the tree is not restructured after it
+        was built.
         Args:
             separator (str): Separates
             tree_item (QWidgetItem): Item which directory is returned as a string
 
         Returns: String of directory of a given QWidgetItem in a QWidgetTree
         """
-        dir = str(tree_item.data(0, 0))
-        try:
-            dir = self.get_dirtext(tree_item.parent()) + separator + dir
-        except:
-            pass
+        use_cache = separator == self.DIRTEXT_SEPARATOR
+        # collect the items up to the root (or up to an item with a cached
+        # directory text) without recursion
+        items = []
+        dir = None
+        while tree_item is not None:
+            if use_cache:
+                dir = tree_item.data(0, self.DIRTEXT_ROLE)
+                if dir is not None:
+                    break
+            items.append(tree_item)
+            tree_item = tree_item.parent()
+        for tree_item in reversed(items):
+            key = str(tree_item.data(0, 0))
+            dir = key if dir is None else dir + separator + key
+            if use_cache:
+                tree_item.setData(0, self.DIRTEXT_ROLE, dir)
         return dir
 
     def set_nr_attributes(self):
@@ -290,6 +365,7 @@ class DictView(qt.QtWidgets.QWidget):
         Sets QLabel text of self.attr_nr as the number of attributes (childs)
         of the current QWidgetItem.
         """
+        self.populate_titem(self.tree_widget.currentItem())
         self.attr_nr.setText('Number of attributes: %s'
                              % self.tree_widget.currentItem().childCount())
 
@@ -302,23 +378,23 @@ class DictView(qt.QtWidgets.QWidget):
                 recursively showed/hidden
             hide (bool): False to hide item+children, True to show item+children
         """
-        for i in range(titem.childCount()):
-            self.show_all(titem.child(i), hide=hide)
-        titem.setHidden(hide)
+        stack = [titem]
+        while stack:
+            titem = stack.pop()
+            titem.setHidden(hide)
+            stack += [titem.child(i) for i in range(titem.childCount())]
 
     def show_titem(self, titem: qt.QtWidgets.QTreeWidgetItem, expand=False):
         """
-        Shows QTreeWidgetItem and its parent recursively until root_item.
+        Shows QTreeWidgetItem and its parents up to the root_item.
         Args:
             titem (QTreeWidgetItem): Item which is displayed
             expand (bool): True to expand of Item which is shown
         """
-        titem.setHidden(False)
-        titem.setExpanded(expand)
-        try:
-            self.show_titem(titem.parent(), expand=expand)
-        except:
-            pass
+        while titem is not None:
+            titem.setHidden(False)
+            titem.setExpanded(expand)
+            titem = titem.parent()
 
     def hide_all_empty(self, titem: qt.QtWidgets.QTreeWidgetItem):
         """
@@ -327,12 +403,16 @@ class DictView(qt.QtWidgets.QWidget):
         Args:
             titem (QTreeWidgetItem): Item to start hiding empty keys recursively
         """
-        if titem.childCount() == 0:
-            if titem.data(1, 0) == '':
-                titem.setHidden(True)
-        else:
-            for i in range(titem.childCount()):
-                self.hide_all_empty(titem.child(i))
+        stack = [titem]
+        while stack:
+            titem = stack.pop()
+            if titem.childCount() == 0:
+                # items whose children are not created yet are not empty
+                if titem.data(1, 0) == '' and \
+                        titem not in self._pending_subtrees:
+                    titem.setHidden(True)
+            else:
+                stack += [titem.child(i) for i in range(titem.childCount())]
 
     def hide_item(self):
         """
@@ -482,35 +562,46 @@ class DictView(qt.QtWidgets.QWidget):
             self.current_search_options = self.get_current_search_options()
             self.find_only_params = find_only_params
 
+            # The substring search itself runs in Qt (findItems). Items which
+            # match in several columns are only added once, such that they
+            # are not visited repeatedly when cycling through the results.
+            # the search needs the full tree
+            self.populate_titem(self.root_item, recursive=True)
             self.found_titem_list = []
+            found_titems = set()
             for column in self.get_current_search_options(as_int=True):
-                self.found_titem_list = \
-                    self.found_titem_list + \
-                    self.tree_widget.findItems(
+                for titem in self.tree_widget.findItems(
                         find_str,
                         qt.QtCore.Qt.MatchFlag.MatchContains |
                         qt.QtCore.Qt.MatchFlag.MatchRecursive,
-                        column=column)
+                        column=column):
+                    if titem not in found_titems:
+                        found_titems.add(titem)
+                        self.found_titem_list.append(titem)
 
             # If user wants to search only in parameters
             if find_only_params:
                 titem_list = []
                 for titem in self.found_titem_list:
-                    try:
-                        if titem.parent().data(0, 0) == 'parameters':
-                            titem_list.append(titem)
-                    except:
-                        pass
+                    parent = titem.parent()
+                    if parent is not None and \
+                            parent.data(0, 0) == 'parameters':
+                        titem_list.append(titem)
                 self.found_titem_list = titem_list
             self.find_text.setText('Entries found: %s'
                                    % (len(self.found_titem_list)))
             # If search is not empty, only QTreeWidgetItem which are found
             # are displayed
             if not self.found_titem_list == []:
-                self.show_all(self.root_item, hide=True)
-                for titem in self.found_titem_list:
-                    titem.setHidden(False)
-                    self.show_titem(titem, expand=True)
+                # the view is only repainted once after hiding all items
+                # and showing the found ones
+                self.tree_widget.setUpdatesEnabled(False)
+                try:
+                    self.show_all(self.root_item, hide=True)
+                    for titem in self.found_titem_list:
+                        self.show_titem(titem, expand=True)
+                finally:
+                    self.tree_widget.setUpdatesEnabled(True)
             self.found_idx = 0
         # if list of found QTreeWidgetItems is empty and no search parameters
         # are changed, 'Entries found = 0' is displayed,
@@ -537,11 +628,46 @@ class DictView(qt.QtWidgets.QWidget):
             self.find_text.setText('Entries found: %s'
                                    % (len(self.found_titem_list)))
 
+    def populate_titem(self, titem: qt.QtWidgets.QTreeWidgetItem,
+                       recursive=False):
+        """
+        Creates the children of a QTreeWidgetItem, if they have not been
+        created yet (see dict_to_titem). Connected to the itemExpanded signal
+        of the tree widget.
+        Args:
+            titem (QTreeWidgetItem): Item whose children are created
+            recursive (bool): True to create the entire branch of titem
+        """
+        if not self._pending_subtrees:
+            return
+        sorting_enabled = self.tree_widget.isSortingEnabled()
+        if recursive:
+            # Adding rows to a sorted tree schedules a sort of the entire
+            # tree, which is executed as soon as an item is accessed. Hence,
+            # the tree is only sorted once after creating the entire branch.
+            self.tree_widget.setSortingEnabled(False)
+        stack = [titem]
+        while stack and self._pending_subtrees:
+            titem = stack.pop()
+            subtree = self._pending_subtrees.pop(titem, None)
+            if subtree is not None:
+                titem.setChildIndicatorPolicy(
+                    qt.QtWidgets.QTreeWidgetItem.ChildIndicatorPolicy
+                    .DontShowIndicatorWhenChildless)
+                self.dict_to_titem(subtree[0], titem, param=subtree[1])
+            if recursive:
+                stack += [titem.child(i) for i in range(titem.childCount())]
+        if recursive:
+            self.tree_widget.setSortingEnabled(sorting_enabled)
+
     def dict_to_titem(self, dictdata: dict,
                       parent: qt.QtWidgets.QTreeWidgetItem,
                       param=False):
         """
-        Creates recursively a QTreeWidgetItem tree from a given dictionary.
+        Creates a QTreeWidgetItem tree from a given dictionary. Only the
+        first level is created, the children of the new items are created
+        when they are needed (see populate_titem), such that large
+        dictionaries are displayed quickly.
         If dictionary contains 'parameters', the values of the parameters are
         already displayed in the column of the respective parameter itself, i.e.
 
@@ -560,22 +686,36 @@ class DictView(qt.QtWidgets.QWidget):
             param(bool): True if parent is a parameter dictionary,
                 i.e. parent.data(0,0) = 'parameters'
         """
+        # The rows are added to the parent in one call, such that the
+        # model is updated once per dictionary instead of once per row.
+        row_items = []
         for key, val in dictdata.items():
-            self.tree_add_row(str(key), val, parent, param)
-
-    def tree_add_row(self, key: str, val,
-                     tree_widget: qt.QtWidgets.QTreeWidgetItem,
-                     param=False):
-        """
-        Adds children to a given tree_widget item from dictionary entries.
+            row_item, subtree = self.create_row_item(str(key), val, param)
+            row_items.append(row_item)
+            if subtree is not None and len(subtree[0]):
+                # show the expand indicator even though the children are
+                # not created yet
+                row_item.setChildIndicatorPolicy(
+                    qt.QtWidgets.QTreeWidgetItem.ChildIndicatorPolicy
+                    .ShowIndicator)
+                self._pending_subtrees[row_item] = subtree
+        parent.addChildren(row_items)
+
+    def create_row_item(self, key: str, val, param=False):
+        """
+        Creates the QTreeWidgetItem of a dictionary entry.
         Args:
             key(str): Key of the dictionary as a string.
             val: Item of the dictionary.
-            tree_widget (QTreeWidgetItem): Parent tree widget onto key is added
-                as a QTreeWidgetItem
             param(bool): True if key is a parameter,
-                i.e. tree_widget.data(0,0)= 'parameters'
+                i.e. the parent item has the key 'parameters'
+
+        Returns:
+            QTreeWidgetItem: The row of the dictionary entry
+            tuple or None: (dictdata, param) arguments of dict_to_titem for
+            the children of the row. None if the row has no children.
         """
+        subtree = None
         if isinstance(val, dict):
             value_text = ''
             # if the key is a parameter, the respective value of the parameter
@@ -587,15 +727,12 @@ class DictView(qt.QtWidgets.QWidget):
                 # the entire parameter value content is displayed.
                 value_text = str(val.get('value', val))
             row_item = qt.QtWidgets.QTreeWidgetItem([key, value_text])
-            if key == 'parameters':
-                self.dict_to_titem(val, row_item, param=True)
-            else:
-                self.dict_to_titem(val, row_item, param=False)
+            subtree = (val, key == 'parameters')
         else:
             row_item = qt.QtWidgets.QTreeWidgetItem([key, str(val)])
         if '\n' in row_item.data(1, 0):
             row_item.setSizeHint(1, qt.QtCore.QSize(100, 50))
-        tree_widget.addChild(row_item)
+        return row_item, subtree
 
 
 class ComparisonDictView(DictView):
@@ -604,9 +741,9 @@ class ComparisonDictView(DictView):
      stations in multiple columns. Some functions of DictView need to be
      overwritten.
     """
-    def tree_add_row(self, key: str, val: dict,
-                        tree_widget: qt.QtWidgets.QTreeWidgetItem, param=False):
+    def create_row_item(self, key: str, val: dict, param=False):
         from pycqed.utilities.settings_manager import Timestamp as Timestamp
+        subtree = None
         values = [''] * len(self.column_header[1:])
         if all((tsp in self.column_header[1:] and
                (isinstance(tsp, Timestamp)))
@@ -625,13 +762,13 @@ class ComparisonDictView(DictView):
                         qt.QtGui.QColor('darkGrey')))
         else:
             row_item = qt.QtWidgets.QTreeWidgetItem([key] + values)
-            self.dict_to_titem(val, row_item)
+            subtree = (val, False)
 
         if any('\n' in row_item.data(i, 0)
                for i in range(len(self.column_header))):
             for i in range(len(self.column_header)):
                 row_item.setSizeHint(i, qt.QtCore.QSize(100, 50))
-        tree_widget.addChild(row_item)
+        return row_item, subtree
 
     def copy_content(self, column: int):
         cb = qt.QtWidgets.QApplication.clipboard()
@@ -766,6 +903,9 @@ class AdditionalWindow(qt.QtWidgets.QMainWindow):
                 children in the additional window
         """
         super(AdditionalWindow, self).__init__()
+        # the viewer copies the entire branch of the current item
+        dict_view.populate_titem(dict_view.tree_widget.currentItem(),
+                                 recursive=True)
         self.setCentralWidget(
             TreeItemViewer(dict_view.tree_widget.currentItem(),
                            screen, dict_view.column_header))
@@ -1,14 +1,23 @@
 import sys
 
 from matplotlib.backends.qt_compat import QtWidgets, QtGui, QtCore
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
-from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT
 
 QtWidgets = QtWidgets
 QtGui = QtGui
 QtCore = QtCore
-FigureCanvasQTAgg = FigureCanvasQTAgg
-NavigationToolbar2QT = NavigationToolbar2QT
+
+
+def __getattr__(name):
+    # The matplotlib Qt backend is only needed by the plotting GUIs and is
+    # imported on first access, such that GUIs which only need the Qt
+    # bindings (e.g. the dict viewer) start faster.
+    if name in ('FigureCanvasQTAgg', 'NavigationToolbar2QT'):
+        from matplotlib.backends import backend_qt5agg
+        globals()['FigureCanvasQTAgg'] = backend_qt5agg.FigureCanvasQTAgg
+        globals()['NavigationToolbar2QT'] = \
+            backend_qt5agg.NavigationToolbar2QT
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 """
 PyQt and PySide (the two python bindings of Qt) generally follow the same 
@@ -562,8 +562,9 @@ class AcquisitionDevice():
         tbase = np.arange(
             0, acq_length,
             1 / self.acq_sampling_rate)
-        cosI = np.cos(2 * np.pi * mod_freq * tbase + acq_IQ_angle)
-        sinI = np.sin(2 * np.pi * mod_freq * tbase + acq_IQ_angle)
+        # cosine and sine from a single complex exponential
+        phasor = np.exp(1j * (2 * np.pi * mod_freq * tbase + acq_IQ_angle))
+        cosI, sinI = phasor.real, phasor.imag
         if weights_type == 'SSB':
             return [(cosI, -sinI), (sinI * aQs, cosI * aQs)]
         elif weights_type in 'DSB':
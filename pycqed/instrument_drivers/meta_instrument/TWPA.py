@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 import qcodes as qc
 from qcodes.instrument.parameter import (
     ManualParameter, InstrumentRefParameter)
@@ -16,6 +17,22 @@ class TWPAObject(MeasurementObject):
     and characterizing the TWPA and the corresponding helper functions.
     """
 
+    PULSED_RO_PULSE = {'pulse_type': 'GaussFilteredCosIQPulse',
+                       'gaussian_filter_sigma': 1e-08,
+                       'operation_type': 'RO'}
+    """Fixed parameters of the readout pulse played by the acquisition
+    device if pulsed() is True. Completed in prepare_readout."""
+    DUMMY_RO_PULSE = {'pulse_type': 'SquarePulse',
+                      'amplitude': 0,
+                      'length': 100e-9,
+                      'operation_type': 'RO'}
+    """Fixed parameters of the dummy readout pulse used to trigger the
+    acquisition if pulsed() is False. Completed in prepare_readout."""
+    MAX_MWG_PREPARATION_THREADS = 3
+    """Maximum number of threads used to prepare the MWGs in parallel if
+    parallel_mwg_preparation() is True, one for each of pump, signal and
+    LO."""
+
     def __init__(self, name, **kw):
         super().__init__(name, **kw)
 
@@ -25,53 +42,79 @@ class TWPAObject(MeasurementObject):
                            parameter_class=InstrumentRefParameter)
         self.add_parameter('instr_lo', parameter_class=InstrumentRefParameter)
 
+        # Instruments resolved by _get_instr. An entry is removed whenever
+        # the corresponding instrument reference parameter is set.
+        self._instr_cache = {}
+        # whether instr_lo and instr_signal are equal, None if unknown. Reset
+        # together with the cache of _get_instr.
+        self._same_lo_sig = None
+        # names of the acquisition devices which were checked to be UHFs in
+        # prepare_readout. Reset together with the cache of _get_instr.
+        self._idn_verified = set()
+        for instr_name in ['pump', 'signal', 'lo', 'acq', 'mc', 'pulsar']:
+            self.parameters[f'instr_{instr_name}'].set_parser = (
+                lambda val, self=self, n=instr_name:
+                self._reset_instr_cache(n, val))
+        # thread pool of _prepare_mwgs, created when it is first needed
+        self._mwg_executor = None
+        # (key, detector) of the last readout preparation, see
+        # prepare_readout
+        self._readout_cache = None
+        # channels of the acquisition device in the pulsar, see
+        # _get_awg_channels
+        self._awg_channel_cache = {}
+        # settings used by signal_freq during a sweep, see _get_freq_ctx
+        self._freq_ctx = None
+
         # Add pump control parameters
         self.add_parameter('pump_freq', label='Pump frequency', unit='Hz',
                            get_cmd=(lambda self=self:
-                                    self.instr_pump.get_instr().frequency()),
+                                    self._get_instr('pump').frequency()),
                            set_cmd=(lambda val, self=self:
-                                    self.instr_pump.get_instr().frequency(val)))
+                                    self._get_instr('pump').frequency(val)))
         self.add_parameter('pump_power', label='Pump power', unit='dBm',
                            get_cmd=(lambda self=self:
-                                    self.instr_pump.get_instr().power()),
+                                    self._get_instr('pump').power()),
                            set_cmd=(lambda val, self=self:
-                                    self.instr_pump.get_instr().power(val)))
+                                    self._get_instr('pump').power(val)))
         self.add_parameter('pump_status', label='Pump status',
                            get_cmd=(lambda self=self:
-                                    self.instr_pump.get_instr().status()),
+                                    self._get_instr('pump').status()),
                            set_cmd=(lambda val, self=self:
-                                    self.instr_pump.get_instr().status(val)))
+                                    self._get_instr('pump').status(val)))
 
         # Add signal control parameters
         def set_freq(val, self=self):
-            if self.pulsed():
-                self.instr_signal.get_instr().frequency(val - self.acq_mod_freq())
-                if self.instr_lo() != self.instr_signal():
-                    self.instr_lo.get_instr().frequency(val - self.acq_mod_freq())
+            pulsed, mod_freq, same_lo_sig = \
+                self._freq_ctx or self._get_freq_ctx()
+            if pulsed:
+                self._get_instr('signal').frequency(val - mod_freq)
+                if not same_lo_sig:
+                    self._get_instr('lo').frequency(val - mod_freq)
             else:
-                self.instr_signal.get_instr().frequency(val)
-                self.instr_lo.get_instr().frequency(val - self.acq_mod_freq())
+                self._get_instr('signal').frequency(val)
+                self._get_instr('lo').frequency(val - mod_freq)
 
         # Add signal control parameters
         def get_freq(self=self):
             if self.pulsed():
-                return self.instr_signal.get_instr().frequency() + \
+                return self._get_instr('signal').frequency() + \
                        self.acq_mod_freq()
             else:
-                return self.instr_signal.get_instr().frequency()
+                return self._get_instr('signal').frequency()
 
         self.add_parameter('signal_freq', label='Signal frequency', unit='Hz',
                            get_cmd=get_freq, set_cmd=set_freq)
         self.add_parameter('signal_power', label='Signal power', unit='dBm',
                            get_cmd=(lambda self=self:
-                                    self.instr_signal.get_instr().power()),
+                                    self._get_instr('signal').power()),
                            set_cmd=(lambda val, self=self:
-                                    self.instr_signal.get_instr().power(val)))
+                                    self._get_instr('signal').power(val)))
         self.add_parameter('signal_status', label='Signal status',
                            get_cmd=(lambda self=self:
-                                    self.instr_signal.get_instr().status()),
+                                    self._get_instr('signal').status()),
                            set_cmd=(lambda val, self=self:
-                                    self.instr_signal.get_instr().status(val)))
+                                    self._get_instr('signal').status(val)))
 
         # add pulse parameters
         self.add_parameter('pulsed', parameter_class=ManualParameter,
@@ -82,13 +125,127 @@ class TWPAObject(MeasurementObject):
         self.add_parameter('pulse_amplitude', parameter_class=ManualParameter,
                            vals=vals.Numbers(0, 1.0), unit='V',
                            initial_value=0.01)
-
+        self.add_parameter('parallel_mwg_preparation',
+                           parameter_class=ManualParameter,
+                           vals=vals.Bool(), initial_value=False,
+                           docstring='Whether the MWGs are prepared in '
+                                     'parallel threads in prepare_readout. '
+                                     'Only enable this if the drivers of '
+                                     'the MWGs can be used from several '
+                                     'threads.')
+
+
+    def _get_instr(self, instr_name):
+        """Returns the instrument referenced by instr_{instr_name}.
+
+        The instrument is looked up only once and cached until the reference
+        parameter is set or the instrument is closed, such that the getters
+        and setters of this object do not resolve the reference on every
+        call.
+
+        Args:
+            instr_name (str): name of the reference without the 'instr_'
+                prefix, e.g. 'pump'
+        """
+        instr = self._instr_cache.get(instr_name)
+        if instr is None or not qc.Instrument.is_valid(instr):
+            instr = self.parameters[f'instr_{instr_name}'].get_instr()
+            self._instr_cache[instr_name] = instr
+        return instr
+
+    def _reset_instr_cache(self, instr_name, val):
+        """Removes an instrument from the cache of _get_instr.
+
+        Used as set_parser of the instrument reference parameters.
+
+        Args:
+            instr_name (str): name of the reference without the 'instr_'
+                prefix
+            val (str): the new value of the reference parameter, which is
+                returned unchanged
+        """
+        self._instr_cache.pop(instr_name, None)
+        if instr_name in ['lo', 'signal']:
+            self._same_lo_sig = None
+        elif instr_name == 'acq':
+            self._idn_verified.clear()
+        return val
+
+    def _prepare_mwgs(self):
+        """Turns off the pulse modulation of the pump, signal and LO MWGs
+        and turns on the signal and LO MWGs.
+
+        If parallel_mwg_preparation() is True, each MWG is prepared in a
+        separate thread of a pool which is kept for subsequent calls. The
+        references are grouped by instrument such that a MWG used for
+        several of them only receives commands from one thread.
+        """
+        mwgs = {}
+        for instr_name in ['pump', 'signal', 'lo']:
+            mwg = self._get_instr(instr_name)
+            turn_on = mwgs.get(mwg.name, (None, False))[1]
+            mwgs[mwg.name] = (mwg, turn_on or instr_name != 'pump')
+
+        def prepare_mwg(mwg, turn_on):
+            mwg.pulsemod_state('Off')
+            if turn_on:
+                mwg.on()
+
+        if not self.parallel_mwg_preparation():
+            for mwg, turn_on in mwgs.values():
+                prepare_mwg(mwg, turn_on)
+            return
+        if self._mwg_executor is None:
+            self._mwg_executor = ThreadPoolExecutor(
+                max_workers=self.MAX_MWG_PREPARATION_THREADS,
+                thread_name_prefix=f'{self.name}_mwg')
+        futures = [self._mwg_executor.submit(prepare_mwg, mwg, turn_on)
+                   for mwg, turn_on in mwgs.values()]
+        for future in futures:
+            # waits for all threads and raises their exceptions, if any
+            future.result()
+
+    def close(self):
+        if self._mwg_executor is not None:
+            self._mwg_executor.shutdown()
+            self._mwg_executor = None
+        super().close()
+
+    def _get_freq_ctx(self):
+        """Returns the settings which determine how signal_freq is set.
+
+        _measure_1D and _measure_2D store them in _freq_ctx for the duration
+        of a sweep, such that they are not read again for every point.
+
+        Returns:
+            tuple: pulsed(), acq_mod_freq() and whether instr_lo and
+            instr_signal refer to the same MWG
+        """
+        if self._same_lo_sig is None:
+            self._same_lo_sig = self.instr_lo() == self.instr_signal()
+        return self.pulsed(), self.acq_mod_freq(), self._same_lo_sig
+
+    def _sync_lo(self):
+        """Sets the frequency of instr_lo to match the signal frequency.
+
+        This sets instr_lo to the same frequency as setting signal_freq to
+        its current value, without querying and setting instr_signal. The
+        frequency of instr_signal is taken from the cache of its frequency
+        parameter.
+        """
+        sig_freq = self._get_instr('signal').frequency.get_latest()
+        pulsed, mod_freq, same_lo_sig = self._get_freq_ctx()
+        if pulsed:
+            if not same_lo_sig:
+                self._get_instr('lo').frequency(sig_freq)
+        else:
+            self._get_instr('lo').frequency(sig_freq - mod_freq)
 
     def on(self):
-        self.instr_pump.get_instr().on()
+        self._get_instr('pump').on()
 
     def off(self):
-        self.instr_pump.get_instr().off()
+        self._get_instr('pump').off()
 
     def get_operation_dict(self, operation_dict=None):
         operation_dict = super().get_operation_dict(operation_dict)
@@ -100,74 +257,129 @@ class TWPAObject(MeasurementObject):
             op['op_code'] = code
         return operation_dict
 
-    def prepare_readout(self):
-        UHF = self.instr_acq.get_instr()
-        if not UHF.IDN()['model'].startswith('UHF'):
-            raise NotImplementedError(
-                'The UHFQC_correlation_detector used for TWPA tuneup '
-                'measurements is not implemented for '
-                '{acq_dev.name}, but only for ZI UHF devices.')
-        pulsar = self.instr_pulsar.get_instr()
+    def prepare_readout(self, reuse=False):
+        """Prepares the MWGs, the UHF and the AWGs for a TWPA measurement.
+
+        Args:
+            reuse (bool): if True and the readout parameters did not change
+                since the last call, the integration weights, AWG program
+                and detector of the last call are reused and only the MWGs
+                are prepared and the AWGs are started. Should only be used
+                if no other measurement was run in between. Defaults to
+                False.
+
+        Returns:
+            UHFQC_correlation_detector: the detector to pass to MC
+        """
+        UHF = self._get_instr('acq')
+        # the model of the device does not change, so it is checked once
+        if UHF.name not in self._idn_verified:
+            if not UHF.IDN()['model'].startswith('UHF'):
+                raise NotImplementedError(
+                    'The UHFQC_correlation_detector used for TWPA tuneup '
+                    'measurements is not implemented for '
+                    '{acq_dev.name}, but only for ZI UHF devices.')
+            self._idn_verified.add(UHF.name)
+        pulsar = self._get_instr('pulsar')
 
         # Prepare MWG states
-        self.instr_pump.get_instr().pulsemod_state('Off')
-        self.instr_signal.get_instr().pulsemod_state('Off')
-        self.instr_lo.get_instr().pulsemod_state('Off')
-        self.instr_signal.get_instr().on()
-        self.instr_lo.get_instr().on()
+        self._prepare_mwgs()
         # make sure that the lo frequency is set correctly
-        self.signal_freq(self.signal_freq())
+        self._sync_lo()
+
+        # each readout parameter is read once
+        readout_key = (UHF.name, pulsar.name, self.pulsed(),
+                       self.acq_mod_freq(), self.acq_weights_type(),
+                       self.pulse_length(), self.pulse_amplitude(),
+                       self.acq_length(), self.acq_averages())
+        (_, _, pulsed, mod_freq, weights_type, pulse_length, pulse_amplitude,
+         acq_length, acq_averages) = readout_key
+        if reuse and self._readout_cache is not None \
+                and self._readout_cache[0] == readout_key:
+            pulsar.start(exclude=[UHF.name])
+            return self._readout_cache[1]
 
         # Prepare integration weights
         UHF.acquisition_set_weights(
             channels=[(0, 0), (0, 1)],
-            weights_type=self.acq_weights_type(),
-            mod_freq=self.acq_mod_freq(),
+            weights_type=weights_type,
+            mod_freq=mod_freq,
         )
 
         # Program the AWG
-        if self.pulsed():
-            pulse = {'pulse_type': 'GaussFilteredCosIQPulse',
-                     'I_channel': pulsar._id_channel('ch1', UHF.name),
-                     'Q_channel': pulsar._id_channel('ch2', UHF.name),
-                     'amplitude': self.pulse_amplitude(),
-                     'pulse_length': self.pulse_length(),
-                     'gaussian_filter_sigma': 1e-08,
-                     'mod_frequency': self.acq_mod_freq(),
-                     'operation_type': 'RO'}
+        ch_i, ch_q, awg_channels = self._get_awg_channels(pulsar, UHF.name)
+        if pulsed:
+            pulse = dict(self.PULSED_RO_PULSE,
+                         I_channel=ch_i,
+                         Q_channel=ch_q,
+                         amplitude=pulse_amplitude,
+                         pulse_length=pulse_length,
+                         mod_frequency=mod_freq)
         else:  # dummy_pulse
-            pulse = {'pulse_type': 'SquarePulse',
-                     'channels': pulsar.find_awg_channels(UHF.name),
-                     'amplitude': 0,
-                     'length': 100e-9,
-                     'operation_type': 'RO'}
+            pulse = dict(self.DUMMY_RO_PULSE, channels=list(awg_channels))
         sq.pulse_list_list_seq([[pulse]])
         pulsar.start(exclude=[UHF.name])
 
         # Create the detector
-        return det.UHFQC_correlation_detector(
+        detector = det.UHFQC_correlation_detector(
             acq_dev=UHF,
             AWG=UHF,
-            integration_length=self.acq_length(),
-            nr_averages=self.acq_averages(),
+            integration_length=acq_length,
+            nr_averages=acq_averages,
             channels=[(0, 0), (0, 1)],
             correlations=[((0, 0), (0, 0)), ((0, 1), (0, 1))],
             value_names=['I', 'Q', 'I^2', 'Q^2'],
             single_int_avg=True)
-
-    def _measure_1D(self, parameter, values, label, analyze=True):
-
-        MC = self.instr_mc.get_instr()
+        self._readout_cache = (readout_key, detector)
+        return detector
+
+    def _get_awg_channels(self, pulsar, awg_name):
+        """Returns the pulsar channels of an AWG used by prepare_readout.
+
+        Looking up the channels iterates over all channels of the pulsar,
+        so the result is cached. It is looked up again if channels were
+        added to the pulsar.
+
+        Args:
+            pulsar (Pulsar): the pulsar instance
+            awg_name (str): name of the AWG
+
+        Returns:
+            tuple: the names of the channels with ids 'ch1' and 'ch2' and
+            the list of all channels of the AWG
+        """
+        key = (pulsar.name, awg_name, len(pulsar.channels))
+        channels = self._awg_channel_cache.get(key)
+        if channels is None:
+            channels = (pulsar._id_channel('ch1', awg_name),
+                        pulsar._id_channel('ch2', awg_name),
+                        pulsar.find_awg_channels(awg_name))
+            self._awg_channel_cache[key] = channels
+        return channels
+
+    def invalidate_readout(self):
+        """Forces the next call of prepare_readout to prepare the readout
+        from scratch, even if called with reuse=True."""
+        self._readout_cache = None
+
+    def _measure_1D(self, parameter, values, label, analyze=True,
+                    reuse_readout=False):
+
+        MC = self._get_instr('mc')
 
         initial_value = parameter()
 
-        detector = self.prepare_readout()
+        detector = self.prepare_readout(reuse=reuse_readout)
 
         MC.set_sweep_function(parameter)
         MC.set_sweep_points(values)
         MC.set_detector_function(detector)
 
-        MC.run(name=label + self.msmt_suffix)
+        self._freq_ctx = self._get_freq_ctx()
+        try:
+            MC.run(name=label + self.msmt_suffix)
+        finally:
+            self._freq_ctx = None
         if analyze:
             ma.MeasurementAnalysis(auto=True)
 
@@ -176,7 +388,7 @@ class TWPAObject(MeasurementObject):
     def _measure_2D(self, parameter1, parameter2, values1, values2,
                     label, analyze=True):
 
-        MC = self.instr_mc.get_instr()
+        MC = self._get_instr('mc')
 
         detector = self.prepare_readout()
 
@@ -188,97 +400,98 @@ class TWPAObject(MeasurementObject):
         MC.set_sweep_points(values1)
         MC.set_sweep_points_2D(values2)
         MC.set_detector_function(detector)
-        MC.run_2D(name=label + self.msmt_suffix)
+        self._freq_ctx = self._get_freq_ctx()
+        try:
+            MC.run_2D(name=label + self.msmt_suffix)
+        finally:
+            self._freq_ctx = None
         if analyze:
             ma.MeasurementAnalysis(TwoD=True, auto=True)
 
         parameter1(initial_value1)
         parameter2(initial_value2)
 
-    def measure_vs_pump_freq(self, pump_freqs, analyze=True):
+    def _measure_pump_on_off(self, parameters, values, ref_values, label,
+                             ref_label, analysis_label, analyze=True):
+        """Runs a scan with the pump on and a reference scan with the pump off.
+
+        The readout prepared for the scan with the pump on is reused for the
+        reference scan. If analyze is True, both scans are analyzed together
+        with Amplifier_Characterization_Analysis.
+
+        Args:
+            parameters (list): the swept parameter, or the parameters of the
+                first and second sweep dimension for a 2D scan
+            values (list): the sweep points for each of the parameters
+            ref_values (array): the sweep points of the first parameter for
+                the 1D reference scan with the pump off
+            label (str): the measurement label of the scan with the pump on
+            ref_label (str): the measurement label of the reference scan
+            analysis_label (str): common label of both scans, used to find
+                their timestamps for the analysis
+            analyze (bool): whether to analyse the measurements
+        """
         timestamp_start = a_tools.current_timestamp()
         self.on()
-        label = f'pump_freq_scan_pp{self.pump_power():.2f}dB_' + \
-                f'sf{self.signal_freq()/1e9:.3f}G'
-        self._measure_1D(self.pump_freq, pump_freqs, label, analyze)
+        if len(parameters) == 1:
+            self._measure_1D(parameters[0], values[0], label, analyze)
+        else:
+            self._measure_2D(*parameters, *values, label, analyze)
         self.off()
-        label = f'pump_freq_scan_off_sf{self.signal_freq() / 1e9:.3f}G'
-        self._measure_1D(self.pump_freq, pump_freqs[:1], label, analyze)
+        self._measure_1D(parameters[0], ref_values, ref_label, analyze,
+                         reuse_readout=True)
         if analyze:
             timestamps = a_tools.get_timestamps_in_range(
-                timestamp_start, label='pump_freq_scan')
+                timestamp_start, label=analysis_label)
             ca.Amplifier_Characterization_Analysis(timestamps)
 
+    def measure_vs_pump_freq(self, pump_freqs, analyze=True):
+        # the signal frequency is not changed by the scans, read it once
+        sf = self.signal_freq() / 1e9
+        self._measure_pump_on_off(
+            [self.pump_freq], [pump_freqs], pump_freqs[:1],
+            f'pump_freq_scan_pp{self.pump_power():.2f}dB_sf{sf:.3f}G',
+            f'pump_freq_scan_off_sf{sf:.3f}G', 'pump_freq_scan', analyze)
+
     def measure_vs_signal_freq(self, signal_freqs, analyze=True):
-        timestamp_start = a_tools.current_timestamp()
-        self.on()
-        label = f'signal_freq_scan_pp{self.pump_power():.2f}dB_' + \
-                f'pf{self.pump_freq() / 1e9:.3f}G'
-        self._measure_1D(self.signal_freq, signal_freqs, label, analyze)
-        self.off()
-        label = 'signal_freq_scan_off'
-        self._measure_1D(self.signal_freq, signal_freqs, label, analyze)
-        if analyze:
-            timestamps = a_tools.get_timestamps_in_range(
-                timestamp_start, label='signal_freq_scan')
-            ca.Amplifier_Characterization_Analysis(timestamps)
+        self._measure_pump_on_off(
+            [self.signal_freq], [signal_freqs], signal_freqs,
+            f'signal_freq_scan_pp{self.pump_power():.2f}dB_'
+            f'pf{self.pump_freq() / 1e9:.3f}G',
+            'signal_freq_scan_off', 'signal_freq_scan', analyze)
 
     def measure_vs_pump_power(self, pump_powers, analyze=True):
-        timestamp_start = a_tools.current_timestamp()
-        self.on()
-        label = f'pump_power_scan_pf{self.pump_freq() / 1e9:.3f}G_' + \
-                f'sf{self.signal_freq() / 1e9:.3f}G'
-        self._measure_1D(self.pump_power, pump_powers, label, analyze)
-        self.off()
-        label = f'pump_power_scan_off_sf{self.signal_freq() / 1e9:.3f}G'
-        self._measure_1D(self.pump_power, pump_powers[:1], label, analyze)
-        if analyze:
-            timestamps = a_tools.get_timestamps_in_range(
-                timestamp_start, label='pump_power_scan')
-            ca.Amplifier_Characterization_Analysis(timestamps)
+        # the signal frequency is not changed by the scans, read it once
+        sf = self.signal_freq() / 1e9
+        self._measure_pump_on_off(
+            [self.pump_power], [pump_powers], pump_powers[:1],
+            f'pump_power_scan_pf{self.pump_freq() / 1e9:.3f}G_sf{sf:.3f}G',
+            f'pump_power_scan_off_sf{sf:.3f}G', 'pump_power_scan', analyze)
 
     def measure_vs_signal_freq_pump_freq(self, signal_freqs, pump_freqs,
                                          analyze=True):
-        timestamp_start = a_tools.current_timestamp()
-        self.on()
-        label = f'signal_freq_pump_freq_scan_pp{self.pump_power():.2f}dB'
-        self._measure_2D(self.signal_freq, self.pump_freq, signal_freqs,
-                         pump_freqs, label, analyze)
-        self.off()
-        label = f'signal_freq_pump_freq_scan_off'
-        self._measure_1D(self.signal_freq, signal_freqs, label, analyze)
-        if analyze:
-            timestamps = a_tools.get_timestamps_in_range(
-                timestamp_start, label='signal_freq_pump_freq_scan')
-            ca.Amplifier_Characterization_Analysis(timestamps)
+        self._measure_pump_on_off(
+            [self.signal_freq, self.pump_freq], [signal_freqs, pump_freqs],
+            signal_freqs,
+            f'signal_freq_pump_freq_scan_pp{self.pump_power():.2f}dB',
+            'signal_freq_pump_freq_scan_off', 'signal_freq_pump_freq_scan',
+            analyze)
 
     def measure_vs_signal_freq_pump_power(self, signal_freqs, pump_powers,
                                          analyze=True):
-        timestamp_start = a_tools.current_timestamp()
-        self.on()
-        label = f'signal_freq_pump_power_scan_pf{self.pump_freq() / 1e9:.3f}G'
-        self._measure_2D(self.signal_freq, self.pump_power, signal_freqs,
-                         pump_powers, label, analyze)
-        self.off()
-        label = f'signal_freq_pump_power_scan_off'
-        self._measure_1D(self.signal_freq, signal_freqs, label, analyze)
-        if analyze:
-            timestamps = a_tools.get_timestamps_in_range(
-                timestamp_start, label='signal_freq_pump_power_scan')
-            ca.Amplifier_Characterization_Analysis(timestamps)
+        self._measure_pump_on_off(
+            [self.signal_freq, self.pump_power], [signal_freqs, pump_powers],
+            signal_freqs,
+            f'signal_freq_pump_power_scan_pf{self.pump_freq() / 1e9:.3f}G',
+            'signal_freq_pump_power_scan_off', 'signal_freq_pump_power_scan',
+            analyze)
 
     def measure_vs_pump_freq_pump_power(self, pump_freqs, pump_powers,
                                         analyze=True):
-        timestamp_start = a_tools.current_timestamp()
-        self.on()
-        label = f'pump_freq_pump_power_scan_sf{self.signal_freq() / 1e9:.3f}G'
-        self._measure_2D(self.pump_freq, self.pump_power, pump_freqs,
-                         pump_powers, label, analyze)
-        self.off()
-        label = f'pump_freq_pump_power_scan_off_' + \
-                f'sf{self.signal_freq() / 1e9:.3f}G'
-        self._measure_1D(self.pump_freq, pump_freqs[:1], label, analyze)
-        if analyze:
-            timestamps = a_tools.get_timestamps_in_range(
-                timestamp_start, label='pump_freq_pump_power_scan')
-            ca.Amplifier_Characterization_Analysis(timestamps)
\ No newline at end of file
+        # the signal frequency is not changed by the scans, read it once
+        sf = self.signal_freq() / 1e9
+        self._measure_pump_on_off(
+            [self.pump_freq, self.pump_power], [pump_freqs, pump_powers],
+            pump_freqs[:1], f'pump_freq_pump_power_scan_sf{sf:.3f}G',
+            f'pump_freq_pump_power_scan_off_sf{sf:.3f}G',
+            'pump_freq_pump_power_scan', analyze)
@@ -88,12 +88,9 @@ def get_transmon_resonator_coupling(qubit: QuDev_transmon,
     else:
         assert all([uss_transmon_freq, uss_readout_freq,
                     lss_transmon_freq, lss_readout_freq])
-        E_c = qubit_parameters["E_c"]
-        readout_frequency_difference = uss_readout_freq - lss_readout_freq
-        Delta_uss = uss_transmon_freq - uss_readout_freq
-        Delta_lss = lss_transmon_freq - lss_readout_freq
-        coefficient = (1 / (E_c - Delta_uss)) - (1 / (E_c - Delta_lss))
-        g = np.sqrt(readout_frequency_difference / coefficient)
+        g = estimate_transmon_resonator_coupling(
+            qubit_parameters["E_c"], uss_transmon_freq, uss_readout_freq,
+            lss_transmon_freq, lss_readout_freq)
 
         if update:
             qubit_parameters["coupling"] = g
@@ -101,6 +98,35 @@ def get_transmon_resonator_coupling(qubit: QuDev_transmon,
         return g
 
 
+def estimate_transmon_resonator_coupling(E_c, uss_transmon_freq,
+                                         uss_readout_freq, lss_transmon_freq,
+                                         lss_readout_freq):
+    r"""
+    Estimate the transmon-readout coupling strength from the transmon and
+    readout frequencies at the upper and lower sweet spots.
+
+    All arguments can be floats or arrays of the same shape (e.g.,
+    one entry per qubit), in which case the couplings of all qubits are
+    computed at once.
+
+    Arguments:
+        E_c: charging energy of the transmon (in Hz).
+        uss_transmon_freq: transmon frequency at upper sweet spot.
+        uss_readout_freq: readout frequency at upper sweet spot.
+        lss_transmon_freq: transmon frequency at lower sweet spot.
+        lss_readout_freq: readout frequency at lower sweet spot.
+
+    See get_transmon_resonator_coupling for the estimation equation.
+    """
+    E_c = np.asarray(E_c)
+    readout_frequency_difference = np.subtract(uss_readout_freq,
+                                               lss_readout_freq)
+    Delta_uss = np.subtract(uss_transmon_freq, uss_readout_freq)
+    Delta_lss = np.subtract(lss_transmon_freq, lss_readout_freq)
+    coefficient = (1 / (E_c - Delta_uss)) - (1 / (E_c - Delta_lss))
+    return np.sqrt(readout_frequency_difference / coefficient)
+
+
 def append_DCsources(routine):
     """
     Append the DC_sources of a routine as an attribute. This is used when
@@ -646,6 +646,11 @@ class PollDetector(Hard_Detector, metaclass=TimedMetaClass):
     the poll method of an acquisition device.
     """
     TIMED_METHODS = ["prepare"]
+    POLL_SLEEP_MIN = 1e-4
+    """Initial waiting time (in s) before polling the acquisition devices in
+    poll_data. It is doubled after each poll without new data, up to
+    POLL_SLEEP_MAX, and reset when new data arrives."""
+    POLL_SLEEP_MAX = 0.01
 
     def __init__(self, acq_dev=None, detectors=None,
                  prepare_and_finish_pulsar=False,
@@ -769,21 +774,25 @@ class PollDetector(Hard_Detector, metaclass=TimedMetaClass):
 
         # Acquire data
         accumulated_time = 0
+        poll_sleep = self.POLL_SLEEP_MIN
         self.timer.checkpoint("PollDetector.poll_data.loop.start")
         while not all(np.concatenate(list(gotem.values()))):
             dataset = {}
             for acq_dev in self.acq_devs:
                 if not all(gotem[acq_dev.name]):
-                    time.sleep(0.01)
+                    time.sleep(poll_sleep)
                     dataset[acq_dev.name] = acq_dev.poll(0.01)
                     # store additional data if provided by the acq_dev
                     for ed in acq_dev.pop_extra_data():
                         self.extra_data_callback(acq_dev.name, **ed)
+            # back off while the acquisition devices have no new data
+            poll_sleep = min(2 * poll_sleep, self.POLL_SLEEP_MAX)
             for acq_dev_name in dataset.keys():
                 n_sp = self.det_from_acq_dev[acq_dev_name].nr_sweep_points
                 for n, p in enumerate(acq_paths[acq_dev_name]):
                     if p not in dataset[acq_dev_name]:
                         continue
+                    poll_sleep = self.POLL_SLEEP_MIN
                     data[acq_dev_name][n] = np.concatenate([
                         data[acq_dev_name][n], *dataset[acq_dev_name][p]])
                     n_data = len(data[acq_dev_name][n])
@@ -30,6 +30,10 @@ class SHFQCPulsar(SHFAcquisitionModulesPulsar, SHFGeneratorModulesPulsar):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # superclass handling each channel, indexed by channel name. Filled
+        # in create_channel_parameters to avoid looking up the channel id in
+        # the methods that take a channel name.
+        self._channel_superclasses = {}
 
     def create_awg_parameters(self, channel_name_map: dict):
         super().create_awg_parameters(channel_name_map)
@@ -128,7 +132,9 @@ class SHFQCPulsar(SHFAcquisitionModulesPulsar, SHFGeneratorModulesPulsar):
         For the SHFQC, valid channel ids are sg#i, sg#q, qa1i and qa1q, where #
         is a number from 1 to 6. This defines the harware port used.
         """
-        return self._get_superclass(id).create_channel_parameters(
+        superclass = self._get_superclass(id)
+        self._channel_superclasses[ch_name] = superclass
+        return superclass.create_channel_parameters(
             self, id, ch_name, ch_type)
 
     def _check_if_implemented(self, id:str, param:str):
@@ -161,16 +167,20 @@ class SHFQCPulsar(SHFAcquisitionModulesPulsar, SHFGeneratorModulesPulsar):
         return SHFAcquisitionModulesPulsar.is_awg_running(self) and \
                SHFGeneratorModulesPulsar.is_awg_running(self)
 
+    def _get_channel_superclass(self, ch):
+        superclass = self._channel_superclasses.get(ch)
+        if superclass is None:
+            superclass = self._get_superclass(self.pulsar.get(ch + '_id'))
+            self._channel_superclasses[ch] = superclass
+        return superclass
+
     def sigout_on(self, ch, on=True):
-        id = self.pulsar.get(ch + '_id')
-        return self._get_superclass(id).sigout_on(self, ch, on=on)
+        return self._get_channel_superclass(ch).sigout_on(self, ch, on=on)
 
     def get_params_for_spectrum(self, ch: str, requested_freqs: list[float]):
-        id = self.pulsar.get(ch + '_id')
-        return self._get_superclass(id) \
+        return self._get_channel_superclass(ch) \
             .get_params_for_spectrum(self, ch, requested_freqs)
 
     def get_frequency_sweep_function(self, ch: str, **kw):
-        id = self.pulsar.get(ch + '_id')
-        return self._get_superclass(id) \
+        return self._get_channel_superclass(ch) \
             .get_frequency_sweep_function(self, ch, **kw)
\ No newline at end of file
@@ -14,6 +14,13 @@ log = logging.getLogger(__name__)
 
 pulse.pulse_libraries.add(sys.modules[__name__])
 
+_unit_gauss_envelope_cache = {}
+"""dict: Cache of the unit-amplitude envelopes of SSB_DRAG_pulse, see
+SSB_DRAG_pulse._gauss_envelopes. The entries are kept in the order of their
+last use, such that the least recently used ones are evicted first."""
+UNIT_GAUSS_ENVELOPE_CACHE_SIZE = 128
+"""int: Maximum number of entries in _unit_gauss_envelope_cache."""
+
 
 class SSB_DRAG_pulse(pulse.Pulse):
     """In-phase Gaussian pulse with derivative quadrature and SSB modulation.
@@ -29,6 +36,13 @@ class SSB_DRAG_pulse(pulse.Pulse):
     SUPPORT_INTERNAL_MOD = True
     SUPPORT_HARMONIZING_AMPLITUDE = True
 
+    WAVEFORM_DTYPE = np.float64
+    """Floating point type used for computing the envelopes and applying the
+    modulation. Can be set to np.float32 to halve the memory traffic of the
+    waveform generation, since the resolution of the AWGs is well below
+    single precision. The modulation phase is always computed in double
+    precision."""
+
     def __init__(self, element_name, I_channel, Q_channel,
                  name='SSB Drag pulse', **kw):
         """In-phase Gaussian pulse with derivative quadrature and SSB modulation.
@@ -66,6 +80,12 @@ class SSB_DRAG_pulse(pulse.Pulse):
         self.Q_channel = Q_channel
 
         self.phaselock = kw.pop('phaselock', True)
+        # The I and Q waveforms are always computed together. While waveforms
+        # renders the channels of the pulse, the waveform of the channel that
+        # was not requested is kept here (together with a key of the
+        # parameters it was computed for) until chan_wf is called for that
+        # channel. None outside of waveforms, see chan_wf.
+        self._wf_cache = None
 
     @classmethod
     def pulse_params(cls):
@@ -95,32 +115,173 @@ class SSB_DRAG_pulse(pulse.Pulse):
     def length(self):
         return self.sigma * self.nr_sigma
 
+    def waveforms(self, tvals_dict):
+        # Only cache the waveform of the other quadrature while the channels
+        # of this call are rendered, such that no full-length array stays on
+        # the pulse (and in copies of the segment) afterwards.
+        self._wf_cache = {}
+        try:
+            return super().waveforms(tvals_dict)
+        finally:
+            self._wf_cache = None
+
     def chan_wf(self, channel, tvals):
+        if channel not in [self.I_channel, self.Q_channel]:
+            return np.zeros_like(tvals)
+        # Reuse the waveform computed together with the other quadrature if
+        # nothing changed since. The cache entry is consumed such that the
+        # caller can safely modify the returned array in-place.
+        cache = self._wf_cache
+        if cache is not None:
+            key = self._wf_cache_key(tvals)
+            cached_key, wf = cache.pop(channel, (None, None))
+            if cached_key == key:
+                return wf
+
         half = self.nr_sigma * self.sigma / 2
         tc = self.algorithm_time() + half
 
-        gauss_env = np.exp(-0.5 * (tvals - tc) ** 2 / self.sigma ** 2)
-        gauss_env -= np.exp(-0.5 * half ** 2 / self.sigma ** 2)
-        gauss_env *= self.amplitude * (tvals - tc >= -half) * (
-                tvals - tc < half)
-        deriv_gauss_env = -self.motzoi * (tvals - tc) * gauss_env / self.sigma
-
-        if self.mod_frequency is not None:
-            I_mod, Q_mod = apply_modulation(
-                gauss_env, deriv_gauss_env, tvals, self.mod_frequency,
-                phase=self.phase, phi_skew=self.phi_skew, alpha=self.alpha,
-                tval_phaseref=0 if self.phaselock else tc)
-        else:
-            # Ignore the Q component and program the I component to both
-            # channels. See HDAWG8Pulsar._hdawg_mod_setter
-            I_mod, Q_mod = gauss_env, gauss_env
+        I_mod, Q_mod = self._drag_waveforms(
+            tvals, tc, self.amplitude, self.mod_frequency,
+            phase=self.phase, phi_skew=self.phi_skew, alpha=self.alpha,
+            tval_phaseref=0 if self.phaselock else tc)
 
         if channel == self.I_channel:
+            if cache is not None:
+                cache[self.Q_channel] = (key, Q_mod)
             return I_mod
-        elif channel == self.Q_channel:
+        else:
+            if cache is not None:
+                cache[self.I_channel] = (key, I_mod)
             return Q_mod
+
+    def _wf_cache_key(self, tvals):
+        """Returns a key identifying the waveforms returned by chan_wf.
+
+        Args:
+            tvals (np.ndarray): Sample start times in seconds.
+
+        Returns:
+            tuple: The sample grid and all parameters that enter the
+            waveforms of the I and Q channels.
+        """
+        grid = (len(tvals), tvals[0], tvals[-1]) if len(tvals) else (0,)
+        return grid + (self.algorithm_time(), self.amplitude, self.sigma,
+                       self.nr_sigma, self.motzoi, self.mod_frequency,
+                       self.phase, self.alpha, self.phi_skew, self.phaselock,
+                       self.WAVEFORM_DTYPE)
+
+    def _drag_waveforms(self, tvals, tc, amplitude, mod_frequency, **kw):
+        """Computes the I and Q waveforms of a DRAG pulse centered at tc.
+
+        The envelopes and their modulation are only computed for the
+        samples within the pulse window, and written into zero-initialized
+        arrays of the size of tvals.
+
+        Args:
+            tvals (np.ndarray): Sample start times in seconds.
+            tc (float): Center time of the pulse in seconds.
+            amplitude (float): Amplitude of the Gaussian envelope.
+            mod_frequency (float): Modulation frequency in Hz, see
+                apply_modulation. If None, the Gaussian envelope is returned
+                for both channels.
+            **kw: Keyword arguments passed to apply_modulation.
+
+        Returns:
+            np.ndarray, np.ndarray: The waveforms of the I and Q channels.
+        """
+        half = self.nr_sigma * self.sigma / 2
+        idx0, idx1 = window_indices(tvals, tc - half, tc + half)
+        tvals_win = tvals[idx0:idx1]
+        gauss_env, deriv_gauss_env = self._gauss_envelopes(
+            tvals_win, tc, amplitude)
+        if mod_frequency is not None:
+            wfs_win = apply_modulation(gauss_env, deriv_gauss_env, tvals_win,
+                                       mod_frequency, **kw)
         else:
-            return np.zeros_like(tvals)
+            # Ignore the Q component and program the I component to both
+            # channels. See HDAWG8Pulsar._hdawg_mod_setter
+            wfs_win = gauss_env, gauss_env
+        # separate arrays, such that a returned waveform does not keep the
+        # one of the other channel alive
+        dtype = np.result_type(*wfs_win)
+        wfs = []
+        for wf_win in wfs_win:
+            wf = np.zeros(len(tvals), dtype=dtype)
+            wf[idx0:idx1] = wf_win
+            wfs.append(wf)
+        return wfs[0], wfs[1]
+
+    def _gauss_envelopes(self, tvals, tc, amplitude):
+        """Computes the truncated Gaussian envelope and its derivative.
+
+        The unit-amplitude envelopes only depend on the pulse shape and on
+        the position of the samples relative to the pulse center. They are
+        cached in _unit_gauss_envelope_cache and only scaled here, such that
+        identical pulses in a sequence do not recompute the exponential.
+        Sample positions are compared after rounding to
+        HASHABLE_TIME_ROUNDING_DIGITS, as for reusing waveforms.
+
+        Args:
+            tvals (np.ndarray): Sample start times in seconds.
+            tc (float): Center time of the pulse in seconds.
+            amplitude (float): Amplitude of the Gaussian envelope.
+
+        Returns:
+            np.ndarray, np.ndarray: The Gaussian envelope and its derivative
+            scaled by motzoi.
+        """
+        if len(tvals) == 0:
+            return (np.zeros(0, dtype=self.WAVEFORM_DTYPE),
+                    np.zeros(0, dtype=self.WAVEFORM_DTYPE))
+        digits = self.HASHABLE_TIME_ROUNDING_DIGITS
+        key = (self.sigma, self.nr_sigma, self.WAVEFORM_DTYPE, len(tvals),
+               round(tvals[0] - tc, digits), round(tvals[-1] - tc, digits))
+        cache = _unit_gauss_envelope_cache
+        # re-inserting the entry marks it as most recently used
+        unit_envs = cache.pop(key, None)
+        if unit_envs is None:
+            unit_envs = self._unit_gauss_envelopes(tvals, tc)
+            while len(cache) >= UNIT_GAUSS_ENVELOPE_CACHE_SIZE:
+                cache.pop(next(iter(cache)))
+        cache[key] = unit_envs
+        gauss_env, deriv_gauss_env = unit_envs
+        return (amplitude * gauss_env,
+                (-self.motzoi * amplitude) * deriv_gauss_env)
+
+    def _unit_gauss_envelopes(self, tvals, tc):
+        """Computes the unit-amplitude envelopes for _gauss_envelopes.
+
+        The envelopes are calculated in-place in two buffers of the size of
+        tvals to avoid allocating temporary arrays for every operation. The
+        buffers have the type WAVEFORM_DTYPE and are read-only, since they
+        are shared via the cache.
+
+        Args:
+            tvals (np.ndarray): Sample start times in seconds.
+            tc (float): Center time of the pulse in seconds.
+
+        Returns:
+            np.ndarray, np.ndarray: The truncated Gaussian envelope with unit
+            amplitude and its product with (tvals - tc) / sigma.
+        """
+        half = self.nr_sigma * self.sigma / 2
+        idx0, idx1 = window_indices(tvals, tc - half, tc + half)
+        # time in units of sigma, shared by the envelope and its derivative
+        u = np.subtract(tvals, tc)
+        u *= 1 / self.sigma
+        u = u.astype(self.WAVEFORM_DTYPE, copy=False)
+        gauss_env = np.square(u)
+        gauss_env *= -0.5
+        np.exp(gauss_env, out=gauss_env)
+        gauss_env -= np.exp(-0.5 * (self.nr_sigma / 2) ** 2)
+        gauss_env[:idx0] = 0
+        gauss_env[idx1:] = 0
+        deriv_gauss_env = u
+        deriv_gauss_env *= gauss_env
+        gauss_env.setflags(write=False)
+        deriv_gauss_env.setflags(write=False)
+        return gauss_env, deriv_gauss_env
 
     def hashables(self, tstart, channel):
         hashlist = self.common_hashables(tstart, channel)
@@ -197,7 +358,9 @@ class SSB_DRAG_pulse_cos(SSB_DRAG_pulse):
         # in-phase component
         envi = np.cos(np.pi * (tvals - tc) / tg) ** 2
         # truncate
-        envi *= (tvals - tc >= -half) * (tvals - tc < half)
+        idx0, idx1 = window_indices(tvals, tc - half, tc + half)
+        envi[:idx0] = 0
+        envi[idx1:] = 0
         # apply envelope modulation
         envi = envi * amplitude_corr * \
                np.exp(-2j * np.pi * env_mod_freq_corr * (tvals - tc))
@@ -312,15 +475,8 @@ class SSB_DRAG_pulse_with_cancellation(SSB_DRAG_pulse):
         half = self.nr_sigma * self.sigma / 2
         tc = self.algorithm_time() + half + cpars.get('delay', 0.0)
 
-        gauss_env = np.exp(-0.5 * (tvals - tc) ** 2 / self.sigma ** 2)
-        gauss_env -= np.exp(-0.5 * half ** 2 / self.sigma ** 2)
-        gauss_env *= self.amplitude * (tvals - tc >= -half) * (
-                tvals - tc < half)
-        gauss_env *= cpars.get('amplitude', 1.0)
-        deriv_gauss_env = -self.motzoi * (tvals - tc) * gauss_env / self.sigma
-
-        return apply_modulation(
-            gauss_env, deriv_gauss_env, tvals,
+        return self._drag_waveforms(
+            tvals, tc, self.amplitude * cpars.get('amplitude', 1.0),
             cpars.get('mod_frequency', self.mod_frequency),
             phase=self.phase + cpars.get('phase', 0.0),
             phi_skew=cpars.get('phi_skew', self.phi_skew),
@@ -2112,6 +2268,26 @@ class f0g1Pulse(pulse.Pulse):
         return hashlist
 
 
+def window_indices(tvals, tstart, tend):
+    """Returns the indices of the samples with tstart <= tvals < tend.
+
+    Uses a binary search instead of boolean masks, such that no temporary
+    arrays of the size of tvals are allocated.
+
+    Args:
+        tvals (np.ndarray): Sample start times in seconds, sorted in
+            ascending order.
+        tstart (float): Start time of the window in seconds.
+        tend (float): End time of the window in seconds.
+
+    Returns:
+        int, int: The indices idx0 and idx1 such that tvals[idx0:idx1]
+        contains all samples inside the window.
+    """
+    idx0, idx1 = np.searchsorted(tvals, [tstart, tend], side='left')
+    return int(idx0), int(idx1)
+
+
 def apply_modulation(ienv, qenv, tvals, mod_frequency,
                      phase=0., phi_skew=0., alpha=1., tval_phaseref=0.):
     """Applies single sideband modulation, requires tvals to make sure the
@@ -2143,14 +2319,39 @@ def apply_modulation(ienv, qenv, tvals, mod_frequency,
     Returns:
         np.ndarray, np.ndarray: The predistorted and modulated outputs.
     """
-    phi = 360 * mod_frequency * (tvals - tval_phaseref) + phase
-    phii = phi + phi_skew
-    phiq = phi + 90
-
+    # A single complex exponential yields both cos(wt) and sin(wt). The
+    # phase is evaluated directly in the imaginary part of the complex buffer
+    # which is then exponentiated in-place, avoiding temporary arrays.
+    # All constant terms are folded into a single scalar phase offset, such
+    # that only one multiplication and one addition run over the samples.
+    omega = 2 * np.pi * mod_frequency
+    phase_offset = np.deg2rad(phase) - omega * tval_phaseref
+    carrier = np.zeros(len(tvals), dtype=complex)
+    wt = carrier.imag
+    np.multiply(tvals, omega, out=wt)
+    wt += phase_offset
+    np.exp(carrier, out=carrier)
+    # The phase is always evaluated in double precision, but the modulation
+    # is applied in the precision of the envelopes.
+    carrier = carrier.astype(
+        np.result_type(ienv, qenv, np.complex64), copy=False)
+    cos_wt, sin_wt = carrier.real, carrier.imag
+
+    # rotation: [u, v] = [[cos(wt), sin(wt)], [-sin(wt), cos(wt)]] [I, Q]
+    u = ienv * cos_wt
+    u += qenv * sin_wt
+    v = qenv * cos_wt
+    v -= ienv * sin_wt
+
+    # predistortion: only scalar matrix elements, applied in-place
     r = alpha if alpha < 1.0 else 1.0
-    imod = r * (ienv * np.cos(np.deg2rad(phii)) +
-                qenv * np.sin(np.deg2rad(phii)))
-    qmod = r * (ienv * np.cos(np.deg2rad(phiq)) +
-                qenv * np.sin(np.deg2rad(phiq))) / alpha
+    m_iu = r * np.cos(np.deg2rad(phi_skew))
+    m_iv = r * np.sin(np.deg2rad(phi_skew))
+    m_qv = r / alpha
+    imod = u
+    imod *= m_iu
+    imod += m_iv * v
+    qmod = v
+    qmod *= m_qv
 
     return imod, qmod
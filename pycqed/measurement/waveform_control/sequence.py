@@ -6,7 +6,6 @@
 
 import numpy as np
 import pycqed.measurement.waveform_control.pulsar as ps
-from collections import OrderedDict as odict
 from copy import deepcopy, copy
 import logging
 
@@ -36,7 +35,7 @@ class Sequence:
         self.name = name
         self.timer = Timer(self.name)
         self.pulsar = ps.Pulsar.get_instance()
-        self.segments = odict()
+        self.segments = {}
         self.awg_sequence = {}
         self.repeat_patterns = {}
         self.extend(segments)
@@ -111,6 +110,8 @@ class Sequence:
         waveforms = {}
         sequences = {}
         channel_hashes = {}
+        # channel ids, cached per channel to limit calls to pulsar.get
+        chids = {}
         if resolve_segments or (resolve_segments is None
                                 and not self.is_resolved):
             for seg in self.segments.values():
@@ -118,14 +119,14 @@ class Sequence:
                 seg.gen_elements_on_awg()
 
         if trigger_groups is None:
-            trigger_groups = set()
-            for seg in self.segments.values():
-                trigger_groups |= set(seg.elements_on_awg)
+            trigger_groups = set().union(
+                *(seg.elements_on_awg for seg in self.segments.values()))
+        # AWG of each trigger group, looked up once instead of per segment
+        group_awgs = {group: self.pulsar.get_awg_from_trigger_group(group)
+                      for group in trigger_groups}
 
         if awgs is None:
-            awgs = set()
-            for group in trigger_groups:
-                awgs.add(self.pulsar.get_awg_from_trigger_group(group))
+            awgs = set(group_awgs.values())
 
         # Note that method 'self.generate_waveforms_sequences' will be
         # called by 'pulsar._program_awgs' multiple times, but we only
@@ -137,12 +138,11 @@ class Sequence:
                     self.harmonize_amplitude(awg)
 
         for segname, seg in self.segments.items():
-            for group in trigger_groups:
-                awg = self.pulsar.get_awg_from_trigger_group(group)
+            for group, awg in group_awgs.items():
                 if awg not in awgs:
                     continue
                 scaling_factors = self.awg_scaling_factors[awg]
-                sequences.setdefault(awg, odict())
+                sequences.setdefault(awg, {})
                 # Store name of the segment as key and None as value.
                 # This is used when compiling docstrings in seqc.
                 sequences[awg].setdefault(segname, None)
@@ -164,12 +164,20 @@ class Sequence:
                     uelname = group + '_' + elname
                     sequences[awg].setdefault(uelname, {'metadata': {}})
                     metadata = sequences[awg][uelname]['metadata']
+                    # the channels of the element do not depend on the
+                    # codeword
+                    channels = seg.get_element_channels(elname,
+                                                        trigger_group=group)
                     for cw in seg.get_element_codewords(elname,
                                                         trigger_group=group):
                         sequences[awg][uelname].setdefault(cw, {})
-                        for ch in seg.get_element_channels(elname,
-                                                           trigger_group=group):
-                            chid = self.pulsar.get(f'{ch}_id')
+                        # channels (and their hashes) for which waveforms
+                        # still need to be generated
+                        new_wfs = {}
+                        for ch in channels:
+                            if ch not in chids:
+                                chids[ch] = self.pulsar.get(f'{ch}_id')
+                            chid = chids[ch]
                             if awg_sequences:
                                 h = awg_sequences[awg][uelname][cw][chid]
                             else:
@@ -181,13 +189,19 @@ class Sequence:
                                 if uelname not in channel_hashes[ch]:
                                     channel_hashes[ch][uelname] = {}
                                 channel_hashes[ch][uelname][cw] = h
-                            else:
-                                if h not in waveforms:
-                                    wf = seg.waveforms(awgs={awg},
-                                        elements={elname}, channels={ch},
-                                        codewords={cw})
-                                    waveforms[h] = wf.popitem()[1].popitem()[1]\
-                                                     .popitem()[1].popitem()[1]
+                            elif h not in waveforms:
+                                new_wfs[ch] = h
+                        if new_wfs:
+                            # generate the waveforms of all these channels
+                            # in a single call. The returned dict contains
+                            # a single element, see Segment.waveforms.
+                            wfs = seg.waveforms(
+                                awgs={awg}, elements={elname},
+                                channels=set(new_wfs), codewords={cw},
+                                trigger_groups={group})[awg]
+                            wfs = next(iter(wfs.values()))[cw]
+                            for ch, h in new_wfs.items():
+                                waveforms[h] = wfs[chids[ch]]
                     if elname in seg.acquisition_elements:
                         metadata['acq'] = seg.acquisition_mode
                     else:
@@ -242,7 +256,7 @@ class Sequence:
         if awgs is None:
             awgs = sequences[0].pulsar.awgs
         # collect element lengths
-        lengths = odict()
+        lengths = {}
         for i, seq in enumerate(sequences):
             seq_groups.append(set())
             for seg in seq.segments.values():
@@ -253,7 +267,7 @@ class Sequence:
                  if seq.pulsar.get_awg_from_trigger_group(group) in awgs])
             for group in seq_groups[i]:
                 if group not in lengths:
-                    lengths[group] = odict()
+                    lengths[group] = {}
                 for segname, seg in seq.segments.items():
                     elnames = seg.elements_on_awg.get(group, [])
                     for elname in elnames:
@@ -436,11 +450,11 @@ class Sequence:
             number of acquisition elements (list (if per_segment) or int)
 
         """
-        n_readouts = [len(seg.acquisition_elements)
-                      for seg in self.segments.values()]
-        if not per_segment:
-            n_readouts = np.sum(n_readouts)
-        return n_readouts
+        if per_segment:
+            return [len(seg.acquisition_elements)
+                    for seg in self.segments.values()]
+        return sum(len(seg.acquisition_elements)
+                   for seg in self.segments.values())
 
     def n_segments(self):
         """
@@ -541,6 +555,9 @@ class Sequence:
 
         segment_counter = sequences[0].n_segments()
         seg_occurences = [{s: 1 for s in sequences[0].segments}]
+        # names of the sequences merged into each of the merged_seqs. The
+        # merged sequences are renamed once at the end.
+        name_parts = [[sequences[0].name]]
         for seq in sequences[1:]:
             assert seq.n_segments() <= segment_limit, \
                 f"Sequence {seq.name} has more segments ({seq.n_segments()})" \
@@ -551,6 +568,7 @@ class Sequence:
             if merged_seqs[-1].n_segments() + seq.n_segments() > segment_limit:
                 merged_seqs.append(seq)
                 seg_occurences.append({s: 1 for s in seq.segments})
+                name_parts.append([seq.name])
                 segment_counter = seq.n_segments()
             # otherwise merge sequences
             else:
@@ -568,8 +586,7 @@ class Sequence:
 
                 segment_counter += seq.n_segments()
 
-                # update name of merged seq
-                merged_seqs[-1].rename(merged_seqs[-1].name + Sequence.RENAMING_SEPARATOR + seq.name)
+                name_parts[-1].append(seq.name)
                 if merge_repeat_patterns:
                     for ch_name, pattern in seq.repeat_patterns.items():
                         # if channel is already present, update number of
@@ -594,11 +611,14 @@ class Sequence:
                         else:
                             merged_seqs[-1].repeat_patterns.update(
                                 {ch_name: pattern})
-        # compress names
-        for ms in merged_seqs:
-            name_parts = ms.name.split(Sequence.RENAMING_SEPARATOR)
-            if len(name_parts) > 2:
-                ms.rename(f"compressed_{name_parts[0]}-{name_parts[-1]}")
+        # update names of merged seqs, compressing long names
+        for ms, parts in zip(merged_seqs, name_parts):
+            name = Sequence.RENAMING_SEPARATOR.join(parts)
+            parts = name.split(Sequence.RENAMING_SEPARATOR)
+            if len(parts) > 2:
+                ms.rename(f"compressed_{parts[0]}-{parts[-1]}")
+            else:
+                ms.rename(name)
         return merged_seqs
 
     @staticmethod
@@ -657,35 +677,39 @@ class Sequence:
             new soft sweeppoints indices, and the compression factor
 
         """
-        assert len(np.unique([s.n_segments() for s in sequences])) == 1, \
+        n_seg = sequences[0].n_segments()
+        assert all(s.n_segments() == n_seg for s in sequences), \
             "To allow compression, all sequences must have the same number " \
             "of segments"
-        from pycqed.utilities.math import factors
         n_soft_sp = len(sequences)
-        n_seg = sequences[0].n_segments()
         if segment_limit is None:
             segment_limit = np.inf
 
-        # compute possible compression factors
-        compression_fact = np.sort(factors(n_soft_sp))[::-1]
-
-        for factor in compression_fact:
-            if factor * n_seg > segment_limit:
-                # too many segments in sequence, check for smaller factors
-                continue
-            elif factor == 1:
+        # find the largest compression factor, i.e., divisor of n_soft_sp,
+        # for which the compressed sequences respect the segment_limit.
+        # Sequences without segments respect any segment_limit.
+        max_factor = n_soft_sp if segment_limit == np.inf or n_seg == 0 \
+            else int(segment_limit // n_seg)
+        factor = 1
+        for f in range(min(max_factor, n_soft_sp), 1, -1):
+            if n_soft_sp % f == 0:
+                factor = f
+                break
+        else:
+            if 0 < n_seg <= segment_limit:
                 # no compression possible
+                min_factor = next((f for f in range(2, n_soft_sp + 1)
+                                   if n_soft_sp % f == 0), 1)
                 log.warning(f'No compression possible: \n'
                       f'segments per sequence: \t\t{n_seg} \n'
                       f'limit of segments per sequence:\t{segment_limit}\n'
                       f'number of sequences: \t\t{n_soft_sp}\n'
                       f'To enable a compression, change the '
-                      f'limit of segments to {compression_fact[-2] * n_seg} '
+                      f'limit of segments to {min_factor * n_seg} '
                       f'or the number of sequences  to x such that x has a '
                       f'factor f larger than 1 for which f * '
                       f'{n_seg} < {segment_limit}, e.g. x = '
                       f'{np.floor(segment_limit / n_seg)} (full compression)')
-            break
         seg_lim_eff = factor * n_seg
         compressed_2D_sweep = Sequence.merge(sequences, seg_lim_eff,
                                               merge_repeat_patterns)
@@ -0,0 +1,127 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+# allows running the tests without a display. Needs to be set before
+# importing pycqed.gui, which creates the QApplication.
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from pycqed.gui import qt_compat as qt
+from pycqed.gui.dict_viewer import DictView
+
+
+def nested_dict(depth, leaf):
+    """Returns a dictionary nested depth levels deep, with leaf at the
+    bottom."""
+    d = leaf
+    for i in range(depth):
+        d = {f'level_{depth - i - 1}': d}
+    return d
+
+
+class Test_DictView(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = qt.QtWidgets.QApplication.instance() or \
+            qt.QtWidgets.QApplication(sys.argv)
+        cls.screen = cls.app.primaryScreen()
+
+    def find_item(self, dict_view, path):
+        titem = dict_view.root_item
+        for key in path:
+            dict_view.populate_titem(titem)
+            children = [titem.child(i) for i in range(titem.childCount())]
+            titem = [c for c in children if c.data(0, 0) == key][0]
+        return titem
+
+    def test_deep_dict(self):
+        # deeper than the recursion limit, which other modules may raise
+        depth = sys.getrecursionlimit() + 500
+        snap = nested_dict(depth, {
+            'parameters': {'freq': {'value': 5e9, 'unit': 'Hz'}}})
+        dict_view = DictView(snap, screen=self.screen)
+
+        path = [f'level_{i}' for i in range(depth)] + ['parameters']
+        param_titem = self.find_item(dict_view, path)
+        self.assertTrue(param_titem.isExpanded())
+        self.assertEqual(param_titem.child(0).data(0, 0), 'freq')
+        self.assertEqual(param_titem.child(0).data(1, 0), str(5e9))
+        self.assertEqual(
+            dict_view.get_dirtext(param_titem),
+            DictView.DIRTEXT_SEPARATOR.join(path))
+
+        dict_view.expand_branch(dict_view.root_item)
+        dict_view.hide_all_empty(dict_view.root_item)
+        dict_view.reset_window()
+        dict_view.expand_branch(dict_view.root_item, expand=False)
+
+    def test_deep_dict_without_parameters(self):
+        depth = sys.getrecursionlimit() + 500
+        dict_view = DictView(nested_dict(depth, {'key': 'value'}),
+                             screen=self.screen)
+        path = [f'level_{i}' for i in range(depth)] + ['key']
+        titem = self.find_item(dict_view, path)
+        self.assertEqual(titem.data(1, 0), 'value')
+
+    def test_only_parameter_paths_created(self):
+        snap = {
+            'instruments': {
+                'qb1': {
+                    'functions': {'f': {'args': {'a': 1}}},
+                    'parameters': {'freq': {'value': 5e9}},
+                    'submodules': {
+                        'ch1': {'parameters': {'amp': {'value': 0.1}}},
+                        'ch2': {'settings': {'x': {'y': 2}}},
+                    },
+                },
+            },
+            'components': {'qb2': {'settings': {'x': {'y': 2}}}},
+        }
+        dict_view = DictView(snap, screen=self.screen)
+        for path in [['instruments', 'qb1', 'parameters'],
+                     ['instruments', 'qb1', 'submodules', 'ch1',
+                      'parameters']]:
+            titem = self.find_item(dict_view, path)
+            self.assertTrue(titem.isExpanded())
+            self.assertEqual(titem.childCount(), 1)
+        # branches without parameters are only created when expanded
+        for path in [['instruments', 'qb1', 'functions'],
+                     ['instruments', 'qb1', 'submodules', 'ch2'],
+                     ['components']]:
+            titem = self.find_item(dict_view, path[:-1])
+            titem = [titem.child(i) for i in range(titem.childCount())
+                     if titem.child(i).data(0, 0) == path[-1]][0]
+            self.assertIn(titem, dict_view._pending_subtrees)
+            self.assertEqual(titem.childCount(), 0)
+            titem.setExpanded(True)
+            self.assertNotIn(titem, dict_view._pending_subtrees)
+            self.assertEqual(titem.childCount(), 1)
+
+    def test_expand_wide_branch(self):
+        snap = {'instruments': {f'instr_{i}': {
+            'parameters': {f'par_{j}': {'value': j} for j in range(30)},
+            'settings': {f'set_{j}': {'a': {'b': j}} for j in range(10)},
+        } for i in range(100)}}
+        for display_vals in [True, False]:
+            dict_view = DictView(snap, screen=self.screen)
+            sorting = []
+            dict_to_titem = dict_view.dict_to_titem
+
+            def wrapper(*args, **kw):
+                sorting.append(dict_view.tree_widget.isSortingEnabled())
+                return dict_to_titem(*args, **kw)
+
+            with mock.patch.object(dict_view, 'dict_to_titem', wrapper):
+                dict_view.expand_branch(dict_view.root_item,
+                                        display_vals=display_vals)
+            # inserting the items into a sorted tree re-sorts the tree for
+            # every lazily created item
+            self.assertTrue(len(sorting) > 0)
+            self.assertFalse(any(sorting))
+            self.assertTrue(dict_view.tree_widget.isSortingEnabled())
+            self.assertEqual(dict_view._pending_subtrees, {})
+            titem = self.find_item(dict_view, [
+                'instruments', 'instr_99', 'settings', 'set_9', 'a'])
+            self.assertTrue(titem.isExpanded())
+            self.assertEqual(titem.child(0).data(1, 0), '9')
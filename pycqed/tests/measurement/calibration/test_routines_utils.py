@@ -0,0 +1,61 @@
+import os
+import unittest
+import numpy as np
+
+# routines_utils imports the qubit objects, which import pycqed.gui
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from pycqed.measurement.calibration.automatic_calibration_routines import \
+    routines_utils as ru
+
+
+class MockQubit:
+    def __init__(self, qubit_parameters):
+        self.qubit_parameters = qubit_parameters
+
+    def fit_ge_freq_from_dc_offset(self):
+        return self.qubit_parameters
+
+
+class Test_transmon_resonator_coupling(unittest.TestCase):
+
+    E_c = np.array([0.2e9, 0.25e9, 0.18e9])
+    uss_transmon_freq = np.array([6e9, 5.5e9, 6.3e9])
+    uss_readout_freq = np.array([7.01e9, 6.82e9, 7.305e9])
+    lss_transmon_freq = np.array([4.5e9, 4.2e9, 4.9e9])
+    lss_readout_freq = np.array([7.0e9, 6.81e9, 7.3e9])
+
+    def frequencies(self, i=slice(None)):
+        return (self.uss_transmon_freq[i], self.uss_readout_freq[i],
+                self.lss_transmon_freq[i], self.lss_readout_freq[i])
+
+    def test_scalar_matches_get_coupling(self):
+        for i in range(len(self.E_c)):
+            g = ru.estimate_transmon_resonator_coupling(
+                float(self.E_c[i]), *[float(f) for f in self.frequencies(i)])
+            qb_pars = {'E_c': float(self.E_c[i])}
+            qubit = MockQubit(qb_pars)
+            self.assertEqual(g, ru.get_transmon_resonator_coupling(
+                qubit, *self.frequencies(i)))
+            self.assertNotIn('coupling', qb_pars)
+            self.assertEqual(g, ru.get_transmon_resonator_coupling(
+                qubit, *self.frequencies(i), update=True))
+            self.assertEqual(qb_pars['coupling'], g)
+        self.assertAlmostEqual(
+            ru.estimate_transmon_resonator_coupling(
+                0.2e9, 6e9, 7.01e9, 4.5e9, 7.0e9) / 1e6,
+            148.074894889, places=6)
+
+    def test_vectorised_matches_scalar(self):
+        g = ru.estimate_transmon_resonator_coupling(
+            self.E_c, *self.frequencies())
+        self.assertEqual(g.shape, self.E_c.shape)
+        for i in range(len(self.E_c)):
+            self.assertAlmostEqual(
+                g[i], ru.estimate_transmon_resonator_coupling(
+                    float(self.E_c[i]), *[float(f) for f in
+                                          self.frequencies(i)]),
+                delta=1e-9 * g[i])
+        # lists and scalars can be combined as well
+        g2 = ru.estimate_transmon_resonator_coupling(
+            list(self.E_c), *[list(f) for f in self.frequencies()])
+        np.testing.assert_allclose(g2, g, rtol=1e-12)
@@ -0,0 +1,155 @@
+import unittest
+from unittest import mock
+import numpy as np
+
+from pycqed.measurement.waveform_control import pulse_library as pl
+
+
+def reference_drag_waveforms(tvals, t0, amplitude=0.1, sigma=10e-9,
+                             nr_sigma=5, motzoi=0., mod_frequency=1e6,
+                             phase=0., alpha=1., phi_skew=0.):
+    """Direct computation of the SSB_DRAG_pulse waveforms (phaselock=True),
+    without any of the caches of the pulse library."""
+    half = nr_sigma * sigma / 2
+    tc = t0 + half
+    u = (tvals - tc) / sigma
+    gauss = amplitude * (np.exp(-0.5 * u ** 2)
+                         - np.exp(-0.5 * (nr_sigma / 2) ** 2))
+    gauss[(tvals < tc - half) | (tvals >= tc + half)] = 0
+    deriv = -motzoi * u * gauss
+    wt = 2 * np.pi * mod_frequency * tvals + np.deg2rad(phase)
+    u_rot = np.cos(wt) * gauss + np.sin(wt) * deriv
+    v_rot = -np.sin(wt) * gauss + np.cos(wt) * deriv
+    r = min(alpha, 1.)
+    i_mod = r * (np.cos(np.deg2rad(phi_skew)) * u_rot
+                 + np.sin(np.deg2rad(phi_skew)) * v_rot)
+    q_mod = r / alpha * v_rot
+    return i_mod, q_mod
+
+
+class Test_SSB_DRAG_pulse(unittest.TestCase):
+
+    def setUp(self):
+        self.tvals = np.arange(200) / 2.4e9
+        pl._unit_gauss_envelope_cache.clear()
+
+    def tearDown(self):
+        pl._unit_gauss_envelope_cache.clear()
+
+    def make_pulse(self, t0=10e-9, **kw):
+        pulse = pl.SSB_DRAG_pulse('el', 'ch_I', 'ch_Q', motzoi=0.3,
+                                  phase=30., alpha=1.1, phi_skew=5., **kw)
+        pulse.algorithm_time(t0)
+        return pulse
+
+    def assert_waveforms(self, wfs, pulse, channels=('ch_I', 'ch_Q')):
+        ref = dict(zip(('ch_I', 'ch_Q'), reference_drag_waveforms(
+            self.tvals, pulse.algorithm_time(), amplitude=pulse.amplitude,
+            sigma=pulse.sigma, nr_sigma=pulse.nr_sigma, motzoi=pulse.motzoi,
+            mod_frequency=pulse.mod_frequency, phase=pulse.phase,
+            alpha=pulse.alpha, phi_skew=pulse.phi_skew)))
+        self.assertEqual(set(wfs), set(channels))
+        for ch in channels:
+            np.testing.assert_allclose(wfs[ch], ref[ch], rtol=0, atol=1e-12)
+
+    def test_other_quadrature_not_kept(self):
+        pulse = self.make_pulse()
+        self.assert_waveforms(pulse.waveforms({'ch_I': self.tvals}), pulse,
+                              channels=['ch_I'])
+        # no waveform is cached after rendering a single channel
+        self.assertIsNone(pulse._wf_cache)
+        self.assert_waveforms(pulse.waveforms({'ch_Q': self.tvals}), pulse,
+                              channels=['ch_Q'])
+        # a changed parameter is picked up by both quadratures
+        pulse.amplitude = 0.2
+        pulse.motzoi = -0.5
+        self.assert_waveforms(pulse.waveforms(
+            {'ch_I': self.tvals, 'ch_Q': self.tvals}), pulse)
+        self.assertIsNone(pulse._wf_cache)
+        # direct calls of chan_wf are not cached either
+        pulse.phase = 90.
+        wfs = {ch: pulse.chan_wf(ch, self.tvals) for ch in ['ch_I', 'ch_Q']}
+        self.assertIsNone(pulse._wf_cache)
+        self.assert_waveforms(wfs, pulse)
+
+    def test_returned_waveforms_can_be_modified(self):
+        pulse = self.make_pulse()
+        wfs = pulse.waveforms({'ch_I': self.tvals, 'ch_Q': self.tvals})
+        for wf in wfs.values():
+            wf += 1
+        self.assert_waveforms(pulse.waveforms(
+            {'ch_I': self.tvals, 'ch_Q': self.tvals}), pulse)
+
+    def test_channel_waveforms_are_independent(self):
+        pulse = self.make_pulse()
+        wf_I = pulse.chan_wf('ch_I', self.tvals)
+        wf_Q = pulse.chan_wf('ch_Q', self.tvals)
+        for wf in [wf_I, wf_Q]:
+            self.assertIsNone(wf.base)
+            self.assertEqual(wf.shape, self.tvals.shape)
+        self.assertFalse(np.shares_memory(wf_I, wf_Q))
+        wf_Q += 1
+        self.assert_waveforms({'ch_I': wf_I}, pulse, channels=['ch_I'])
+
+
+class Test_unit_gauss_envelope_cache(unittest.TestCase):
+
+    def setUp(self):
+        self.tvals = np.arange(400) / 2.4e9
+        pl._unit_gauss_envelope_cache.clear()
+
+    def tearDown(self):
+        pl._unit_gauss_envelope_cache.clear()
+
+    def waveforms(self, t0, **kw):
+        pulse = pl.SSB_DRAG_pulse('el', 'ch_I', 'ch_Q', motzoi=0.3, **kw)
+        pulse.algorithm_time(t0)
+        wfs = pulse.waveforms({'ch_I': self.tvals, 'ch_Q': self.tvals})
+        ref = reference_drag_waveforms(self.tvals, t0, motzoi=0.3, **kw)
+        return [wfs['ch_I'], wfs['ch_Q']], ref
+
+    def test_hits_for_different_t0(self):
+        orig = pl.SSB_DRAG_pulse._unit_gauss_envelopes
+        with mock.patch.object(pl.SSB_DRAG_pulse, '_unit_gauss_envelopes',
+                               autospec=True, side_effect=orig) as m:
+            # pulses starting 24 and 48 samples later
+            for t0 in [10e-9, 20e-9, 30e-9]:
+                wfs, ref = self.waveforms(t0)
+                np.testing.assert_allclose(wfs, ref, rtol=0, atol=1e-12)
+            self.assertEqual(m.call_count, 1)
+        self.assertEqual(len(pl._unit_gauss_envelope_cache), 1)
+        # the cached buffers are shared and must not be modified
+        for env in next(iter(pl._unit_gauss_envelope_cache.values())):
+            self.assertFalse(env.flags.writeable)
+
+    def test_matches_direct_computation(self):
+        for kw in [dict(), dict(sigma=7e-9, nr_sigma=4, amplitude=-0.3),
+                   dict(mod_frequency=100e6, phase=45., alpha=0.9,
+                        phi_skew=10.)]:
+            with self.subTest(**kw):
+                wfs, ref = self.waveforms(12e-9, **kw)
+                np.testing.assert_allclose(wfs, ref, rtol=0, atol=1e-12)
+        # a pulse which is shifted by less than the rounding precision of
+        # the cache key reuses the envelopes within tolerance
+        self.waveforms(12e-9)
+        wfs, ref = self.waveforms(12e-9 + 0.3e-12)
+        np.testing.assert_allclose(wfs, ref, rtol=0, atol=1e-5)
+
+    def test_eviction(self):
+        cache = pl._unit_gauss_envelope_cache
+        with mock.patch.object(pl, 'UNIT_GAUSS_ENVELOPE_CACHE_SIZE', 3):
+            sigmas = [5e-9, 6e-9, 7e-9]
+            for sigma in sigmas:
+                self.waveforms(10e-9, sigma=sigma)
+            self.assertEqual(len(cache), 3)
+            # using the first entry makes the second the least recently used
+            self.waveforms(10e-9, sigma=sigmas[0])
+            self.waveforms(10e-9, sigma=8e-9)
+            self.assertEqual(len(cache), 3)
+            self.assertEqual([k[0] for k in cache],
+                             [sigmas[2], sigmas[0], 8e-9])
+            # evicted entries are recomputed correctly
+            wfs, ref = self.waveforms(10e-9, sigma=sigmas[1])
+            np.testing.assert_allclose(wfs, ref, rtol=0, atol=1e-12)
+            self.assertEqual(len(cache), 3)
+            self.assertEqual(pl.UNIT_GAUSS_ENVELOPE_CACHE_SIZE, len(cache))
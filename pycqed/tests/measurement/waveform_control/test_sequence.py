@@ -0,0 +1,76 @@
+import unittest
+import random
+import numpy as np
+
+from pycqed.measurement.waveform_control.pulsar import Pulsar
+from pycqed.measurement.waveform_control.sequence import Sequence
+from pycqed.measurement.waveform_control.segment import Segment
+
+from pycqed.instrument_drivers.virtual_instruments.virtual_awg5014 import \
+    VirtualAWG5014
+
+
+class Test_Sequence(unittest.TestCase):
+
+    def setUp(self):
+        # Random instrument name, otherwise error if tests are run too fast...
+        id = random.randint(1, 1000000)
+        self.pulsar = Pulsar(f"pulsar_{id}")
+        self.awg = VirtualAWG5014(f"awg_{id}")
+        self.pulsar.define_awg_channels(self.awg)
+
+    def tearDown(self):
+        self.pulsar.close()
+        self.awg.close()
+
+    def make_sequence(self, name, n_seg=1):
+        return Sequence(name, [Segment(f"seg{i}") for i in range(n_seg)])
+
+    def test_merge_names(self):
+        sep = Sequence.RENAMING_SEPARATOR
+        merged = Sequence.merge([self.make_sequence(n) for n in 'ab'])
+        self.assertEqual([s.name for s in merged], [f'a{sep}b'])
+        merged = Sequence.merge([self.make_sequence(n) for n in 'abc'])
+        self.assertEqual([s.name for s in merged], ['compressed_a-c'])
+        # names of sequences which are not merged with any other sequence
+        # are compressed as well
+        merged = Sequence.merge(
+            [self.make_sequence(f'x{sep}y{sep}z', 2), self.make_sequence('w')] +
+            [self.make_sequence(n) for n in 'ab'], segment_limit=2)
+        self.assertEqual([s.name for s in merged],
+                         ['compressed_x-z', f'w{sep}a', 'b'])
+
+    def test_compress_2D_sweep(self):
+        seqs = [self.make_sequence(f'seq{i}', 3) for i in range(12)]
+        compressed, hard_sp_ind, soft_sp_ind, factor = \
+            Sequence.compress_2D_sweep(seqs, segment_limit=20)
+        self.assertEqual(factor, 6)
+        self.assertEqual([s.n_segments() for s in compressed], [18, 18])
+        np.testing.assert_array_equal(soft_sp_ind, np.arange(2))
+
+    def test_compress_2D_sweep_without_segments(self):
+        # like without segment_limit, all sequences are merged into one
+        for segment_limit in [None, 10]:
+            seqs = [self.make_sequence(f'seq{i}', 0) for i in range(4)]
+            compressed, hard_sp_ind, soft_sp_ind, factor = \
+                Sequence.compress_2D_sweep(seqs, segment_limit=segment_limit)
+            self.assertEqual([s.name for s in compressed],
+                             ['compressed_seq0-seq3'])
+            self.assertEqual(compressed[0].n_segments(), 0)
+            self.assertEqual(factor, 4)
+            np.testing.assert_array_equal(hard_sp_ind, [])
+            np.testing.assert_array_equal(soft_sp_ind, [0])
+        seqs = [self.make_sequence(f'seq{i}', 0) for i in range(4)]
+        _, hard_sp_ind, soft_sp_ind, factor = Sequence.compress_2D_sweep(
+            seqs, segment_limit=10, mc_points=np.arange(3))
+        self.assertEqual(factor, 4)
+        np.testing.assert_array_equal(hard_sp_ind, np.arange(12))
+        np.testing.assert_array_equal(soft_sp_ind, [0])
+        # a single sequence is returned as it is
+        seqs = [self.make_sequence('seq0', 0)]
+        compressed, hard_sp_ind, soft_sp_ind, factor = \
+            Sequence.compress_2D_sweep(seqs, segment_limit=10)
+        self.assertEqual(compressed, seqs)
+        self.assertEqual(factor, 1)
+        np.testing.assert_array_equal(hard_sp_ind, [])
+        np.testing.assert_array_equal(soft_sp_ind, [0])